@@ -1,11 +1,45 @@
-import random
+import csv
+import platform
 import time
 from datetime import datetime
+from typing import IO, Iterable, Optional, Tuple
+
+import numpy as np
 
 from order_book import OrderBook, Side
 
 
-def run_benchmark(num_orders: int = 100_000, output_path: str = "benchmark_results.txt") -> None:
+def generate_orders(num_orders: int, seed: int = 42) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pre-generate random limit orders as numpy arrays (side, price, quantity),
+    so the timed loop measures the book and not the random number generator.
+
+    Sides are 1 for BUY and 0 for SELL.
+    """
+    rng = np.random.default_rng(seed)
+
+    # Prices are drawn as integer ticks of 0.01 around 100.00, like a real
+    # market, so orders share ~100 price levels instead of each order opening
+    # (and later emptying) its own level
+    ticks_per_unit = 100
+    base_tick = 100 * ticks_per_unit
+
+    sides = rng.integers(0, 2, num_orders)
+    price_ticks = base_tick + rng.integers(-50, 51, num_orders)
+    # Dividing integer ticks gives the nearest float to each 2-decimal price
+    prices = price_ticks / ticks_per_unit
+    quantities = rng.integers(1, 101, num_orders)
+
+    return sides, prices, quantities
+
+
+def run_benchmark(
+    num_orders: int = 100_000,
+    output_path: Optional[str] = "benchmark_results.txt",
+    engine: str = "python",
+    warmup_orders: int = 10_000,
+    output: Optional[IO[str]] = None,
+) -> Tuple[float, float]:
     """
     Run a simple synthetic performance benchmark for the OrderBook.
 
@@ -14,45 +48,157 @@ def run_benchmark(num_orders: int = 100_000, output_path: str = "benchmark_resul
         - approximate orders processed per second
 
     Ranges:
-        - Price: base price (100) ±0.5
+        - Price: base price (100) ±50 ticks of 0.01
         - Quantity: 1 to 100 units
 
-    Results are printed to stdout and saved as 'benchmark_results.txt'.
+    Engines:
+        - "python": OrderBook, one add_limit_order call per order. The first
+                    warmup_orders orders are replayed into a throwaway book
+                    before timing, so a tracing JIT (PyPy) has compiled the
+                    matching loop before the measured run.
+        - "numba" : NumbaOrderBook, all orders passed as arrays to the jitted
+                    batch driver (add_limit_orders)
+        - "cython": COrderBook from the compiled order_book_ext extension,
+                    one add_limit_order call per order
+
+    Results are printed to stdout and returned as (elapsed, orders_per_second).
+    A summary line is written to the open file output if given, otherwise
+    appended to output_path (skipped when output_path is None). File I/O
+    happens after the timed section.
     """
-    ob = OrderBook()
+    sides, prices, quantities = generate_orders(num_orders)
 
-    # Seed for reproducibility
-    random.seed(42)
+    if engine in ("python", "cython"):
+        if engine == "cython":
+            from order_book_ext import COrderBook
 
-    base_price = 100.0
+            book_cls = COrderBook
+        else:
+            book_cls = OrderBook
 
-    start = time.perf_counter()
+        # Plain Python tuples, indexing numpy arrays per element is slower
+        orders = [
+            (Side.BUY if side else Side.SELL, price, quantity)
+            for side, price, quantity in zip(
+                sides.tolist(), prices.tolist(), quantities.tolist()
+            )
+        ]
 
-    for i in range(num_orders):
-        side = Side.BUY if random.random() < 0.5 else Side.SELL
+        warmup_ob = book_cls()
+        for side, price, quantity in orders[:warmup_orders]:
+            warmup_ob.add_limit_order(side=side, price=price, quantity=quantity)
 
-        price = base_price + random.uniform(-0.5, 0.5)
+        ob = book_cls()
 
-        quantity = random.randint(1, 100)
+        start = time.perf_counter()
 
-        ob.add_limit_order(side=side, price=price, quantity=quantity)
+        for side, price, quantity in orders:
+            ob.add_limit_order(side=side, price=price, quantity=quantity)
+
+        elapsed = time.perf_counter() - start
+    elif engine == "numba":
+        from order_book_numba import BUY, SELL, NumbaOrderBook
+
+        nb_ob = NumbaOrderBook()
+        side_codes = np.where(sides == 1, BUY, SELL).astype(np.int8)
+
+        start = time.perf_counter()
+        nb_ob.add_limit_orders(side_codes, prices, quantities)
+        elapsed = time.perf_counter() - start
+    else:
+        raise ValueError(f"Unknown benchmark engine: {engine}")
 
-    elapsed = time.perf_counter() - start
     orders_per_second = num_orders / elapsed if elapsed > 0 else float("inf")
+    interpreter = platform.python_implementation()
 
     # Console output
-    print(f"Processed {num_orders:,} orders in {elapsed:.4f} seconds")
+    print(f"[{engine}, {interpreter}] Processed {num_orders:,} orders in {elapsed:.4f} seconds")
     print(f"≈ {orders_per_second:,.0f} orders/second")
 
-    # Append to text file
+    if output is not None:
+        _write_result(output, engine, num_orders, elapsed, orders_per_second)
+    elif output_path is not None:
+        with open(output_path, "a", encoding="utf-8") as f:
+            _write_result(f, engine, num_orders, elapsed, orders_per_second)
+
+    return elapsed, orders_per_second
+
+
+def _write_result(
+    output: IO[str],
+    engine: str,
+    num_orders: int,
+    elapsed: float,
+    orders_per_second: float,
+) -> None:
+    """
+    Write one summary line for a benchmark run and flush it.
+    """
     timestamp = datetime.now().isoformat(timespec="seconds")
-    with open(output_path, "a", encoding="utf-8") as f:
-        f.write(
-            f"[{timestamp}] num_orders={num_orders:,}, "
-            f"elapsed={elapsed:.4f}s, "
-            f"throughput≈{orders_per_second:,.0f} orders/s\n"
+    output.write(
+        f"[{timestamp}] engine={engine}, interpreter={platform.python_implementation()}, "
+        f"num_orders={num_orders:,}, elapsed={elapsed:.4f}s, "
+        f"throughput≈{orders_per_second:,.0f} orders/s\n"
+    )
+    output.flush()
+
+
+def sweep(
+    order_counts: Iterable[int] = (10_000, 100_000, 1_000_000),
+    engines: Iterable[str] = ("python",),
+    output_path: Optional[str] = None,
+    csv_output: bool = False,
+) -> None:
+    """
+    Run the benchmark for every engine and number of orders, opening the
+    results file once for the whole sweep.
+
+    By default summary lines are appended to 'benchmark_results.txt'. With
+    csv_output=True a fresh CSV file (default 'benchmark_results.csv') is
+    written instead, with a header row and one row per run:
+        timestamp, engine, interpreter, num_orders, elapsed_s, orders_per_s
+    """
+    runs = [(engine, num_orders) for engine in engines for num_orders in order_counts]
+
+    if not csv_output:
+        with open(output_path or "benchmark_results.txt", "a", encoding="utf-8") as f:
+            for engine, num_orders in runs:
+                run_benchmark(num_orders, engine=engine, output=f)
+        return
+
+    # The csv module writes its own line endings
+    with open(output_path or "benchmark_results.csv", "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            ["timestamp", "engine", "interpreter", "num_orders", "elapsed_s", "orders_per_s"]
         )
+        for engine, num_orders in runs:
+            elapsed, orders_per_second = run_benchmark(
+                num_orders, output_path=None, engine=engine
+            )
+            writer.writerow(
+                [
+                    datetime.now().isoformat(timespec="seconds"),
+                    engine,
+                    platform.python_implementation(),
+                    num_orders,
+                    f"{elapsed:.6f}",
+                    f"{orders_per_second:.0f}",
+                ]
+            )
+            f.flush()
 
 
 if __name__ == "__main__":
-    run_benchmark()
+    engines = ["python"]
+    if platform.python_implementation() == "CPython":
+        # Numba and the Cython extension are CPython only
+        engines.append("numba")
+        try:
+            import order_book_ext  # noqa: F401
+
+            engines.append("cython")
+        except ImportError:
+            print("Skipping cython engine, build it with: python setup.py build_ext --inplace")
+
+    sweep(order_counts=(100_000,), engines=engines)
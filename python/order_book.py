@@ -2,9 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Callable, Dict, List, Optional, Tuple
-import heapq
-import itertools
+from typing import Dict, List, Optional, Tuple
+import math
 import time
 
 
@@ -18,11 +17,8 @@ class Side(Enum):
     BUY = auto()
     SELL = auto()
 
-    def opposite(self) -> "Side":
-        return Side.BUY if self is Side.SELL else Side.SELL
 
-
-@dataclass
+@dataclass(slots=True)
 class Order:
     """
     Represents an order submitted to the limit order book.
@@ -45,7 +41,7 @@ class Order:
     timestamp: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """
     Represents an executed trade between a buy order and a sell order.
@@ -64,33 +60,40 @@ class Trade:
     timestamp: float
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderNode:
     """
     A node in the doubly linked list for a price level.
 
     Attributes:
         order : The Order object associated with this node.
+        level : Back-pointer to the price level holding this node.
         prev  : Pointer to the previous order node.
         next  : Pointer to the next node order node.
     """
 
     order: Order
+    level: PriceLevel
     prev: Optional["OrderNode"] = None
     next: Optional["OrderNode"] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceLevel:
     """
     Doubly linked list structure of resting orders at a single price.
 
     Attributes:
-        head : First order node in the price level.
-        tail : Last order node in the price level.
+        price     : Price of the level (set when its first order arrives).
+        head      : First order node in the price level.
+        tail      : Last order node in the price level.
+        total_qty : Running total of remaining quantity across all orders
+                    at this price (kept in sync on insert, cancel and fill).
     """
+    price: float = 0.0
     head: Optional[OrderNode] = None
     tail: Optional[OrderNode] = None
+    total_qty: int = 0
 
 
 class OrderBook:
@@ -99,29 +102,49 @@ class OrderBook:
     best price first, and FIFO within each price level.
 
     Separated data structures for price and orders:
-    - Heaps store ONLY price levels (quick to find best price, smaller heaps).
+    - An integer price ladder indexes PriceLevels by tick
+      (levels[i] holds price min_price + i * tick_size).
     - Doubly linked lists (per price) store individual orders (for time priority).
 
-    - Bids: max-heap on price (using min-heap of negative prices)
-    - Asks: min-heap on price
+    Bids and asks share the ladder, as a bid and an ask can never rest at the
+    same price. The best bid / best ask are tracked as ladder indices.
+    Prices must lie on the tick grid inside the ladder, otherwise ValueError is raised.
     """
-    def __init__(self) -> None:
-        # PriceLevel doubly linked list (FIFO at each price)
-        self.bids: Dict[float, PriceLevel] = {}
-        self.asks: Dict[float, PriceLevel] = {}
+    def __init__(
+        self,
+        tick_size: float = 0.01,
+        min_price: float = 0.0,
+        n_ticks: int = 20_000,
+    ) -> None:
+        self.tick_size = tick_size
+        self.min_price = min_price
+        self.n_ticks = n_ticks
+
+        # PriceLevel doubly linked list (FIFO at each price) for every tick,
+        # allocated once up front so matching never creates or drops levels
+        self.levels: List[PriceLevel] = [PriceLevel() for _ in range(n_ticks)]
+
+        # Ladder index of best prices (-1 / n_ticks when that side is empty)
+        self.best_bid_idx = -1
+        self.best_ask_idx = n_ticks
 
-        # Heaps of prices
-        self.bid_heap: List[float] = []
-        self.ask_heap: List[float] = []
+        # Number of non-empty levels per side, so emptying the last level of a
+        # side resets its best index without scanning the rest of the ladder
+        self._n_bid_levels = 0
+        self._n_ask_levels = 0
 
-        # Map order_id -> (side, price, OrderNode)
-        self.order_map: Dict[int, Tuple[Side, float, OrderNode]] = {}
+        # Map order_id -> OrderNode (node.order and node.level hold the rest)
+        self.order_map: Dict[int, OrderNode] = {}
 
-        # Trade log
-        self.trades: List[Trade] = []
+        # Trade log of (buy_order_id, sell_order_id, price, quantity, timestamp)
+        # rows, only turned into Trade objects by get_trades()
+        self.trades: List[Tuple[int, int, float, int, float]] = []
 
-        # For incrementing order IDs
-        self._order_id_counter = itertools.count(1)
+        # Next generated order ID, always above every ID accepted so far
+        self._next_id = 1
+
+        # Freelist of unlinked OrderNodes, reused LIFO by _add_resting_order
+        self._node_pool: List[OrderNode] = []
 
     # ---------- Public API ----------
 
@@ -137,16 +160,22 @@ class OrderBook:
         Add a limit order and immediately match against the opposite side.
         Returns the order ID (generated if not supplied).
         """
+        self._check_price(price)
         if order_id is None:
             order_id = self._next_free_id()
         else:
             if order_id in self.order_map:
                 raise ValueError(f"Order ID {order_id} already exists in the order book.")
+            if order_id >= self._next_id:
+                self._next_id = order_id + 1
         if timestamp is None:
             timestamp = time.time()
 
         order = Order(order_id, side, price, quantity, timestamp)
-        self._match(order)
+        if side is Side.BUY:
+            self._match_buy(order)
+        else:
+            self._match_sell(order)
 
         # Rest remaining quantity after match on the book
         if order.quantity > 0:
@@ -170,12 +199,17 @@ class OrderBook:
         else:
             if order_id in self.order_map:
                 raise ValueError(f"Order ID {order_id} already exists in the order book.")
+            if order_id >= self._next_id:
+                self._next_id = order_id + 1
 
         if timestamp is None:
             timestamp = time.time()
 
         order = Order(order_id, side, price=None, quantity=quantity, timestamp=timestamp)
-        self._match(order)
+        if side is Side.BUY:
+            self._match_buy(order)
+        else:
+            self._match_sell(order)
 
         return order_id
 
@@ -186,15 +220,13 @@ class OrderBook:
 
         O(1) removal by unlinking node pointers in a doubly linked list.
         """
-        info = self.order_map.get(order_id)
-        if info is None:
+        node = self.order_map.get(order_id)
+        if node is None:
             return False
 
-        side, price, node = info
-        book_side = self._book(side)
-        level = book_side.get(price)
-        if level is None:
-            return False
+        level = node.level
+
+        level.total_qty -= node.order.quantity
 
         # Unlink node
         prev_node = node.prev
@@ -212,165 +244,259 @@ class OrderBook:
             # Order node was tail
             level.tail = prev_node
 
-        # Remove if empty price level
+        # Move best price on if the level became empty
         if level.head is None:
-            del book_side[price]
+            self._level_emptied(self._index(level.price))
 
-        # Remove from order map
+        # Remove from order map, recycle the node without keeping the Order alive
         del self.order_map[order_id]
+        del node.order
+        self._node_pool.append(node)
         return True
 
     def best_bid(self) -> Optional[Tuple[float, int]]:
         """
         Return (price, total_quantity_at_price) for best bid, or None if no bids.
         """
-        price = self._peek_best_price(Side.BUY)
-        if price is None:
+        if self.best_bid_idx < 0:
             return None
-        book_side = self._book(Side.BUY)
-        level = book_side[price]
-        qty = self._sum_level_quantity(level)
-        return price, qty
+        level = self.levels[self.best_bid_idx]
+        return level.price, level.total_qty
 
     def best_ask(self) -> Optional[Tuple[float, int]]:
         """
         Return (price, total_quantity_at_price) for best ask, or None if no asks.
         """
-        price = self._peek_best_price(Side.SELL)
-        if price is None:
+        if self.best_ask_idx >= self.n_ticks:
             return None
-        book_side = self._book(Side.SELL)
-        level = book_side[price]
-        qty = self._sum_level_quantity(level)
-        return price, qty
+        level = self.levels[self.best_ask_idx]
+        return level.price, level.total_qty
 
     def get_depth(self, side: Side, levels: int = 5) -> List[Tuple[float, int]]:
         """
         Return top N price levels on given side as list of (price, total_quantity),
         sorted best-to-worst (descending for bids, ascending for asks).
         """
-        book_side = self._book(side)
-
-        if side == Side.BUY:
-            prices = sorted(book_side.keys(), reverse=True)
+        # Walk the ladder outwards from the best price, skipping empty ticks
+        if side is Side.BUY:
+            idx, step, end = self.best_bid_idx, -1, -1
         else:
-            prices = sorted(book_side.keys())
+            idx, step, end = self.best_ask_idx, 1, self.n_ticks
 
+        # No sort of the book: cost is the distance walked, bounded by the
+        # requested number of levels once that many non-empty ticks are found
+        ladder = self.levels
         result: List[Tuple[float, int]] = []
-        for p in prices[:levels]:
-            level = book_side[p]
-            qty = self._sum_level_quantity(level)
-            result.append((p, qty))
+        remaining = levels
+        while remaining > 0 and idx != end:
+            level = ladder[idx]
+            if level.head is not None:
+                result.append((level.price, level.total_qty))
+                remaining -= 1
+            idx += step
         return result
 
     def get_trades(self) -> List[Trade]:
         """
         Return list of all trades executed so far.
         """
-        return list(self.trades)
+        return [Trade(*row) for row in self.trades]
 
     # ---------- Internal helpers ----------
 
-    def _book(self, side: Side) -> Dict[float, PriceLevel]:
+    def _index(self, price: float) -> int:
         """
-        Return the price -> PriceLevel mapping for the given side.
+        Return the ladder index of a price.
         """
-        return self.bids if side == Side.BUY else self.asks
+        return round((price - self.min_price) / self.tick_size)
 
-    def _heap(self, side: Side) -> List[float]:
+    def _check_price(self, price: float) -> None:
         """
-        Return the heap of prices for the given side.
+        Raise ValueError if a price is off the tick grid or outside the ladder.
         """
-        return self.bid_heap if side == Side.BUY else self.ask_heap
+        idx = self._index(price)
+        if abs(self.min_price + idx * self.tick_size - price) > self.tick_size * 1e-6:
+            raise ValueError(f"Price {price} is not a multiple of tick size {self.tick_size}.")
+        if not 0 <= idx < self.n_ticks:
+            raise ValueError(f"Price {price} is outside the order book price range.")
 
-    def _sum_level_quantity(self, level: PriceLevel) -> int:
+    def _level_emptied(self, idx: int) -> None:
         """
-        Sum total quantity at a given price level by traversing its linked list.
+        Account for a price level that just became empty and, if it was the
+        best bid / best ask, move the best index to the next non-empty tick.
         """
-        total = 0
-        node = level.head
-        while node is not None:
-            total += node.order.quantity
-            node = node.next
-        return total
+        levels = self.levels
+        # Every bid rests at or below the best bid and every ask above it
+        if idx <= self.best_bid_idx:
+            self._n_bid_levels -= 1
+            if self._n_bid_levels == 0:
+                self.best_bid_idx = -1
+            elif idx == self.best_bid_idx:
+                while levels[idx].head is None:
+                    idx -= 1
+                self.best_bid_idx = idx
+        else:
+            self._n_ask_levels -= 1
+            if self._n_ask_levels == 0:
+                self.best_ask_idx = self.n_ticks
+            elif idx == self.best_ask_idx:
+                while levels[idx].head is None:
+                    idx += 1
+                self.best_ask_idx = idx
 
     def _next_free_id(self) -> int:
         """
-        Return the next available (non-duplicated) order ID from iterator.
+        Return the next generated order ID. It cannot clash with a resting order,
+        as the counter is kept above every user-supplied ID.
         """
-        while (oid := next(self._order_id_counter)) in self.order_map:
-            pass
+        oid = self._next_id
+        self._next_id = oid + 1
         return oid
 
-    def _match(self, incoming: Order) -> None:
+    def _match_buy(self, incoming: Order) -> None:
         """
-        Match incoming order against the opposite side until it is fully filled,
-        book is empty, or price limits are violated.
+        Match an incoming BUY against the asks until it is fully filled, no asks
+        are left, or the best ask is above its limit price. Trades are stamped
+        with the incoming order's timestamp.
+
+        _match_buy and _match_sell are kept as two copies of the same loop with
+        the side baked in, so the hot loop has no per-fill side branches.
         """
+        incoming_id = incoming.order_id
 
-        price_cmp: Callable[[float], bool]
+        # Market orders (no price) accept any ask
+        limit_price = incoming.price if incoming.price is not None else math.inf
 
-        if incoming.side == Side.BUY:
-            price_cmp = lambda best_price: (
-                incoming.price is None or best_price <= incoming.price
-            )
-        else:
-            price_cmp = lambda best_price: (
-                incoming.price is None or best_price >= incoming.price
-            )
-
-        opposite_side = incoming.side.opposite()
-        opposite_book = self._book(opposite_side)
-
-        while incoming.quantity > 0:
-            # Sweep through the best available price levels on the opposite side,
-            # matching as much of the incoming order as possible, and
-            # stop when incoming order is fully filled or no acceptable prices.
-            best_price = self._pop_best_price_from_heap(opposite_side)
-            if best_price is None:
+        # Hot attributes bound to locals for the matching loop
+        levels = self.levels
+        n_ticks = self.n_ticks
+        order_map = self.order_map
+        trades_append = self.trades.append
+        node_pool_append = self._node_pool.append
+        inc_qty = incoming.quantity
+
+        # All fills share the clock read taken for the incoming order
+        ts = incoming.timestamp
+
+        while inc_qty > 0:
+            # Sweep up through the best ask levels, matching as much of the
+            # incoming order as possible, and stop when it is fully filled or
+            # no acceptable prices are left.
+            best_idx = self.best_ask_idx
+            if best_idx >= n_ticks:
                 # No liquidity
                 break
-
-            if not price_cmp(best_price):
-                # Push back the popped price if no acceptable price
-                self._push_price(best_price, opposite_side)
+            level = levels[best_idx]
+            best_price = level.price
+            if best_price > limit_price:
+                # No acceptable price
                 break
 
-            level = opposite_book.get(best_price)
-            if not level or level.head is None:
-                opposite_book.pop(best_price, None)
-                continue
+            # Match first resting order at this price level (FIFO)
+            node = level.head
+            while node is not None and inc_qty > 0:
+                resting = node.order
+                resting_qty = resting.quantity
+
+                traded_qty = min(inc_qty, resting_qty)
+
+                # Trade at resting order price
+                trades_append((incoming_id, resting.order_id, best_price, traded_qty, ts))
+
+                inc_qty -= traded_qty
+                resting_qty -= traded_qty
+                resting.quantity = resting_qty
+                level.total_qty -= traded_qty
+
+                if resting_qty == 0:
+                    # Remove this resting order from the head of the linked list
+                    filled = node
+                    node = node.next
+                    level.head = node
+                    if node is not None:
+                        node.prev = None
+                    else:
+                        # List became empty
+                        level.tail = None
+                    # Remove from order map and recycle the node
+                    order_map.pop(resting.order_id, None)
+                    del filled.order
+                    node_pool_append(filled)
+
+            if level.head is None:
+                # Move best ask on to the next non-empty level
+                self._level_emptied(best_idx)
+
+        incoming.quantity = inc_qty
+
+    def _match_sell(self, incoming: Order) -> None:
+        """
+        Match an incoming SELL against the bids until it is fully filled, no bids
+        are left, or the best bid is below its limit price. Mirror of _match_buy.
+        """
+        incoming_id = incoming.order_id
+
+        # Market orders (no price) accept any bid
+        limit_price = incoming.price if incoming.price is not None else -math.inf
+
+        # Hot attributes bound to locals for the matching loop
+        levels = self.levels
+        order_map = self.order_map
+        trades_append = self.trades.append
+        node_pool_append = self._node_pool.append
+        inc_qty = incoming.quantity
+
+        # All fills share the clock read taken for the incoming order
+        ts = incoming.timestamp
+
+        while inc_qty > 0:
+            # Sweep down through the best bid levels
+            best_idx = self.best_bid_idx
+            if best_idx < 0:
+                # No liquidity
+                break
+            level = levels[best_idx]
+            best_price = level.price
+            if best_price < limit_price:
+                # No acceptable price
+                break
 
             # Match first resting order at this price level (FIFO)
-            while level.head is not None and incoming.quantity > 0:
-                node = level.head
+            node = level.head
+            while node is not None and inc_qty > 0:
                 resting = node.order
+                resting_qty = resting.quantity
 
-                traded_qty = min(incoming.quantity, resting.quantity)
-                trade_price = best_price  # trade at resting order price
-                self._record_trade(incoming, resting, trade_price, traded_qty)
+                traded_qty = min(inc_qty, resting_qty)
 
-                incoming.quantity -= traded_qty
-                resting.quantity -= traded_qty
+                # Trade at resting order price
+                trades_append((resting.order_id, incoming_id, best_price, traded_qty, ts))
 
-                if resting.quantity == 0:
+                inc_qty -= traded_qty
+                resting_qty -= traded_qty
+                resting.quantity = resting_qty
+                level.total_qty -= traded_qty
+
+                if resting_qty == 0:
                     # Remove this resting order from the head of the linked list
-                    next_node = node.next
-                    level.head = next_node
-                    if next_node is not None:
-                        next_node.prev = None
+                    filled = node
+                    node = node.next
+                    level.head = node
+                    if node is not None:
+                        node.prev = None
                     else:
                         # List became empty
                         level.tail = None
-                    # Remove from order map
-                    self.order_map.pop(resting.order_id, None)
+                    # Remove from order map and recycle the node
+                    order_map.pop(resting.order_id, None)
+                    del filled.order
+                    node_pool_append(filled)
 
             if level.head is None:
-                # Remove if empty price level
-                del opposite_book[best_price]
-            else:
-                # Still has liquidity, push back price into heap
-                self._push_price(best_price, opposite_side)
+                # Move best bid on to the next non-empty level
+                self._level_emptied(best_idx)
+
+        incoming.quantity = inc_qty
 
     def _add_resting_order(self, order: Order) -> None:
         """
@@ -379,17 +505,24 @@ class OrderBook:
         if order.price is None:
             raise ValueError("Resting market orders are not supported")
 
-        book_side = self._book(order.side)
-
-        # Get or create price level
-        level = book_side.get(order.price)
-        if level is None:
-            level = PriceLevel()
-            book_side[order.price] = level
-            self._push_price(order.price, order.side)
-
-        # Append to tail (FIFO)
-        node = OrderNode(order=order)
+        idx = self._index(order.price)
+        level = self.levels[idx]
+        if level.head is None:
+            # First order at this price
+            level.price = order.price
+            if order.side is Side.BUY:
+                self._n_bid_levels += 1
+            else:
+                self._n_ask_levels += 1
+
+        # Append to tail (FIFO), reusing a recycled node when there is one
+        if self._node_pool:
+            node = self._node_pool.pop()
+            node.order = order
+            node.level = level
+            node.prev = node.next = None
+        else:
+            node = OrderNode(order=order, level=level)
         if level.tail is None:
             # Empty list
             level.head = level.tail = node
@@ -397,69 +530,14 @@ class OrderBook:
             level.tail.next = node
             node.prev = level.tail
             level.tail = node
+        level.total_qty += order.quantity
 
-        # Store node pointer in order map
-        self.order_map[order.order_id] = (order.side, order.price, node)
-
-    def _push_price(self, price: float, side: Side) -> None:
-        """
-        Insert a price into the appropriate heap.
-        """
-        if side == Side.BUY:
-            heapq.heappush(self.bid_heap, -price)
-        else:
-            heapq.heappush(self.ask_heap, price)
+        # Update best price index
+        if order.side is Side.BUY:
+            if idx > self.best_bid_idx:
+                self.best_bid_idx = idx
+        elif idx < self.best_ask_idx:
+            self.best_ask_idx = idx
 
-    def _peek_best_price(self, side: Side) -> Optional[float]:
-        """
-        Peek best price without removing it.
-        """
-        heap = self._heap(side)
-        book_side = self._book(side)
-
-        while heap:
-            raw = heap[0]
-            price = -raw if side == Side.BUY else raw
-            level = book_side.get(price)
-            if level is not None and level.head is not None:
-                return price
-            else:
-                # Lazy cleanup of stale price levels, ensures that trades are done
-                # quicker, as heap removal of an arbitrary element is O(n).
-                heapq.heappop(heap)
-        return None
-
-    def _pop_best_price_from_heap(self, side: Side) -> Optional[float]:
-        """
-        Pop and return best price, ensuring it still has liquidity.
-        """
-        heap = self._heap(side)
-        book_side = self._book(side)
-
-        while heap:
-            raw = heapq.heappop(heap)
-            price = -raw if side == Side.BUY else raw
-            level = book_side.get(price)
-            if level is not None and level.head is not None:
-                return price
-        return None
-
-    def _record_trade(self, incoming: Order, resting: Order, price: float, qty: int) -> None:
-        """
-        Record an executed trade.
-        """
-        ts = time.time()
-        if incoming.side == Side.BUY:
-            buy_id, sell_id = incoming.order_id, resting.order_id
-        else:
-            buy_id, sell_id = resting.order_id, incoming.order_id
-
-        self.trades.append(
-            Trade(
-                buy_order_id=buy_id,
-                sell_order_id=sell_id,
-                price=price,
-                quantity=qty,
-                timestamp=ts,
-            )
-        )
+        # Store node pointer in order map
+        self.order_map[order.order_id] = node
@@ -0,0 +1,416 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Cython limit order book with the same public API as order_book.OrderBook.
+
+Orders and price levels live in C struct arrays:
+- nodes : order slots (ID, remaining quantity, tick, prev / next slot), grown
+          with realloc and recycled through a freelist chained on `next`
+- levels: integer tick ladder, levels[i] is the price min_price + i * tick_size,
+          shared by both sides as a bid and an ask can never rest at the same price
+
+Build with `python setup.py build_ext --inplace`. The pure-Python
+order_book.OrderBook remains the fallback where the extension is unavailable
+(e.g. on PyPy).
+"""
+
+from libc.math cimport fabs, llround
+from libc.stdlib cimport free, malloc, realloc
+
+import time
+
+from order_book import Side, Trade
+
+
+cdef enum:
+    NIL = -1
+    BUY = 0
+    SELL = 1
+
+
+ctypedef struct Level:
+    int head
+    int tail
+    long long total_qty
+    double price
+
+
+ctypedef struct Node:
+    long long order_id
+    long long qty
+    int tick
+    int prev
+    int next
+
+
+cdef class COrderBook:
+    """
+    Drop-in alternative to order_book.OrderBook compiled with Cython.
+
+    Prices must lie on the tick grid min_price + k * tick_size for
+    0 <= k < n_ticks, anything else is rejected with ValueError.
+    Order timestamps only stamp the trades they generate, FIFO priority comes
+    from the per-level linked lists.
+    """
+    cdef Level* levels
+    cdef Node* nodes
+    cdef int capacity
+    cdef int free_head
+    cdef long long best_bid_idx
+    cdef long long best_ask_idx
+    # Number of non-empty levels per side
+    cdef long long n_bid_levels
+    cdef long long n_ask_levels
+    cdef long long next_id
+    cdef readonly double tick_size
+    cdef readonly double min_price
+    cdef readonly int n_ticks
+    # order_id -> slot
+    cdef dict order_map
+    # (buy_order_id, sell_order_id, price, quantity, timestamp) rows
+    cdef list trades
+
+    def __cinit__(
+        self,
+        double tick_size=0.01,
+        double min_price=0.0,
+        int n_ticks=20_000,
+        int max_orders=4096,
+    ):
+        cdef int i
+        self.tick_size = tick_size
+        self.min_price = min_price
+        self.n_ticks = n_ticks
+        self.capacity = max_orders if max_orders > 0 else 1
+
+        self.levels = <Level*> malloc(n_ticks * sizeof(Level))
+        self.nodes = <Node*> malloc(self.capacity * sizeof(Node))
+        if self.levels == NULL or self.nodes == NULL:
+            raise MemoryError()
+
+        for i in range(n_ticks):
+            self.levels[i].head = NIL
+            self.levels[i].tail = NIL
+            self.levels[i].total_qty = 0
+            self.levels[i].price = 0.0
+        self._chain_free_slots(0)
+
+        self.best_bid_idx = NIL
+        self.best_ask_idx = n_ticks
+        self.n_bid_levels = 0
+        self.n_ask_levels = 0
+        self.next_id = 1
+        self.order_map = {}
+        self.trades = []
+
+    def __dealloc__(self):
+        free(self.levels)
+        free(self.nodes)
+
+    # ---------- Public API ----------
+
+    def add_limit_order(
+        self,
+        side,
+        double price,
+        long long quantity,
+        order_id=None,
+        timestamp=None,
+    ):
+        """
+        Add a limit order and immediately match against the opposite side.
+        Returns the order ID (generated if not supplied).
+        """
+        cdef int tick = self._price_to_tick(price)
+        cdef long long oid = self._check_order_id(order_id)
+        cdef int side_code = BUY if side is Side.BUY else SELL
+
+        cdef long long remaining = self._match(side_code, oid, tick, quantity, timestamp)
+
+        # Rest remaining quantity after match on the book
+        if remaining > 0:
+            self._add_resting_order(side_code, oid, tick, price, remaining)
+        return oid
+
+    def add_market_order(
+        self,
+        side,
+        long long quantity,
+        order_id=None,
+        timestamp=None,
+    ):
+        """
+        Add a market order which matches against the best available prices
+        until it is fully filled or book is empty. Any remaining quantity is discarded.
+        """
+        cdef long long oid = self._check_order_id(order_id)
+        # A market order is a limit order at the far end of the ladder that never rests
+        if side is Side.BUY:
+            self._match(BUY, oid, self.n_ticks - 1, quantity, timestamp)
+        else:
+            self._match(SELL, oid, 0, quantity, timestamp)
+        return oid
+
+    def cancel_order(self, long long order_id):
+        """
+        Cancel an existing resting order. Returns True if cancelled, False if not found
+        or already fully executed.
+        """
+        slot_obj = self.order_map.pop(order_id, None)
+        if slot_obj is None:
+            return False
+
+        cdef int slot = slot_obj
+        cdef Node* node = &self.nodes[slot]
+        cdef Level* level = &self.levels[node.tick]
+
+        level.total_qty -= node.qty
+
+        # Unlink node
+        if node.prev != NIL:
+            self.nodes[node.prev].next = node.next
+        else:
+            level.head = node.next
+        if node.next != NIL:
+            self.nodes[node.next].prev = node.prev
+        else:
+            level.tail = node.prev
+
+        if level.head == NIL:
+            self._level_emptied(node.tick)
+        self._free_slot(slot)
+        return True
+
+    def best_bid(self):
+        """
+        Return (price, total_quantity_at_price) for best bid, or None if no bids.
+        """
+        if self.best_bid_idx < 0:
+            return None
+        cdef Level* level = &self.levels[self.best_bid_idx]
+        return level.price, level.total_qty
+
+    def best_ask(self):
+        """
+        Return (price, total_quantity_at_price) for best ask, or None if no asks.
+        """
+        if self.best_ask_idx >= self.n_ticks:
+            return None
+        cdef Level* level = &self.levels[self.best_ask_idx]
+        return level.price, level.total_qty
+
+    def get_depth(self, side, int levels=5):
+        """
+        Return top N price levels on given side as list of (price, total_quantity),
+        sorted best-to-worst (descending for bids, ascending for asks).
+        """
+        cdef long long idx, step, end
+        cdef Level* level
+        if side is Side.BUY:
+            idx, step, end = self.best_bid_idx, -1, -1
+        else:
+            idx, step, end = self.best_ask_idx, 1, self.n_ticks
+
+        result = []
+        while idx != end and len(result) < levels:
+            level = &self.levels[idx]
+            if level.head != NIL:
+                result.append((level.price, level.total_qty))
+            idx += step
+        return result
+
+    def get_trades(self):
+        """
+        Return list of all trades executed so far.
+        """
+        return [Trade(*row) for row in self.trades]
+
+    # ---------- Internal helpers ----------
+
+    cdef int _price_to_tick(self, double price) except -1:
+        """
+        Convert a price to its ladder index, rejecting off-grid or out-of-range prices.
+        """
+        cdef long long tick = llround((price - self.min_price) / self.tick_size)
+        if fabs(self.min_price + tick * self.tick_size - price) > self.tick_size * 1e-6:
+            raise ValueError(f"Price {price} is not a multiple of tick size {self.tick_size}.")
+        if not 0 <= tick < self.n_ticks:
+            raise ValueError(f"Price {price} is outside the order book price range.")
+        return <int> tick
+
+    cdef long long _check_order_id(self, order_id) except? -1:
+        """
+        Return a generated order ID, or the supplied one after checking it is unused.
+        """
+        cdef long long oid
+        if order_id is None:
+            # Generated IDs are kept above every user-supplied ID, so cannot clash
+            oid = self.next_id
+            self.next_id = oid + 1
+            return oid
+        if order_id in self.order_map:
+            raise ValueError(f"Order ID {order_id} already exists in the order book.")
+        if order_id >= self.next_id:
+            self.next_id = order_id + 1
+        return order_id
+
+    # except? -1: an incoming quantity of -1 is returned unmatched, so -1 is
+    # also a valid result and Cython must check for a raised exception
+    cdef long long _match(
+        self, int side, long long incoming_id, long long limit_tick, long long qty,
+        timestamp,
+    ) except? -1:
+        """
+        Match incoming order against the opposite side until it is fully filled,
+        book is empty, or the limit tick is violated. Returns the remaining quantity.
+        Trades are stamped with timestamp, or one clock read if it is None.
+        """
+        cdef long long tick, traded, diff
+        cdef int slot, next_slot
+        cdef Level* level
+        cdef Node* node
+        cdef double ts = 0.0 if timestamp is None else timestamp
+        cdef bint have_ts = timestamp is not None
+        cdef list trades = self.trades
+        cdef dict order_map = self.order_map
+
+        while qty > 0:
+            if side == BUY:
+                tick = self.best_ask_idx
+                if tick > limit_tick:
+                    # No liquidity (tick == n_ticks) or no acceptable price
+                    break
+            else:
+                tick = self.best_bid_idx
+                if tick < limit_tick:
+                    break
+
+            # Match first resting order at this price level (FIFO)
+            level = &self.levels[tick]
+            slot = level.head
+            node = &self.nodes[slot]
+            # Branchless min(qty, node.qty): diff >> 63 is all ones when diff < 0
+            diff = qty - node.qty
+            traded = node.qty + (diff & (diff >> 63))
+
+            # All fills of one incoming order share a single execution time
+            if not have_ts:
+                ts = time.time()
+                have_ts = True
+            if side == BUY:
+                trades.append((incoming_id, node.order_id, level.price, traded, ts))
+            else:
+                trades.append((node.order_id, incoming_id, level.price, traded, ts))
+
+            qty -= traded
+            node.qty -= traded
+            level.total_qty -= traded
+
+            if node.qty == 0:
+                # Remove this resting order from the head of the linked list
+                next_slot = node.next
+                level.head = next_slot
+                if next_slot != NIL:
+                    self.nodes[next_slot].prev = NIL
+                else:
+                    level.tail = NIL
+                    self._level_emptied(tick)
+                del order_map[node.order_id]
+                self._free_slot(slot)
+
+        return qty
+
+    cdef int _add_resting_order(
+        self, int side, long long order_id, int tick, double price, long long qty
+    ) except -1:
+        """
+        Append an order to the tail of its price level (FIFO).
+        """
+        if self.free_head == NIL:
+            self._grow()
+
+        cdef int slot = self.free_head
+        cdef Node* node = &self.nodes[slot]
+        cdef Level* level = &self.levels[tick]
+        self.free_head = node.next
+
+        node.order_id = order_id
+        node.qty = qty
+        node.tick = tick
+        node.next = NIL
+        node.prev = level.tail
+
+        if level.tail == NIL:
+            # First order at this price
+            level.head = slot
+            level.price = price
+            if side == BUY:
+                self.n_bid_levels += 1
+            else:
+                self.n_ask_levels += 1
+        else:
+            self.nodes[level.tail].next = slot
+        level.tail = slot
+        level.total_qty += qty
+
+        # Update best price index
+        if side == BUY:
+            if tick > self.best_bid_idx:
+                self.best_bid_idx = tick
+        elif tick < self.best_ask_idx:
+            self.best_ask_idx = tick
+
+        self.order_map[order_id] = slot
+        return 0
+
+    cdef void _level_emptied(self, long long idx):
+        """
+        Account for a price level that just became empty and, if it was the
+        best bid / best ask, move the best index to the next non-empty tick.
+        """
+        # Every bid rests at or below the best bid and every ask above it
+        if idx <= self.best_bid_idx:
+            self.n_bid_levels -= 1
+            if self.n_bid_levels == 0:
+                self.best_bid_idx = NIL
+            elif idx == self.best_bid_idx:
+                while self.levels[idx].head == NIL:
+                    idx -= 1
+                self.best_bid_idx = idx
+        else:
+            self.n_ask_levels -= 1
+            if self.n_ask_levels == 0:
+                self.best_ask_idx = self.n_ticks
+            elif idx == self.best_ask_idx:
+                while self.levels[idx].head == NIL:
+                    idx += 1
+                self.best_ask_idx = idx
+
+    cdef inline void _free_slot(self, int slot):
+        """
+        Push a slot onto the freelist.
+        """
+        self.nodes[slot].next = self.free_head
+        self.free_head = slot
+
+    cdef void _chain_free_slots(self, int start):
+        """
+        Chain slots start .. capacity - 1 into the (empty) freelist, lowest first.
+        """
+        cdef int i
+        for i in range(start, self.capacity - 1):
+            self.nodes[i].next = i + 1
+        self.nodes[self.capacity - 1].next = NIL
+        self.free_head = start
+
+    cdef int _grow(self) except -1:
+        """
+        Double the number of order slots.
+        """
+        cdef int old = self.capacity
+        cdef Node* nodes = <Node*> realloc(self.nodes, 2 * old * sizeof(Node))
+        if nodes == NULL:
+            raise MemoryError()
+        self.nodes = nodes
+        self.capacity = 2 * old
+        self._chain_free_slots(old)
+        return 0
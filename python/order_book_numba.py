@@ -0,0 +1,825 @@
+"""
+Numba-compiled limit order book with the same public API as order_book.OrderBook.
+
+All book state lives in preallocated numpy arrays (structure of arrays) and is
+mutated in place by module-level @njit kernels, the Python class only converts
+prices to ticks, grows the arrays and materializes Trade objects.
+
+Order slots (indexed by slot number, recycled through a freelist):
+- slot_ids  : order ID resting in the slot
+- slot_qtys : remaining quantity
+- slot_ticks: price tick of the slot's level
+- next_idx / prev_idx: doubly linked list pointers within a price level
+
+Price ladder (indexed by integer tick, shared by both sides as a bid and an ask
+can never rest at the same price):
+- heads / tails: first and last slot at each tick (NIL when empty)
+- level_qty    : running total quantity at each tick
+- level_prices : float price the level was created with
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+import time
+
+import numpy as np
+from numba import njit, boolean, float64, int8, int32, int64, types
+from numba.typed import Dict as NumbaDict
+
+from order_book import Side, Trade
+
+
+NIL = -1
+
+# Side codes used by the kernels
+BUY = 0
+SELL = 1
+
+# Indices into the int64 `state` array (scalars shared with the kernels)
+BEST_BID = 0
+BEST_ASK = 1
+FREE_TOP = 2
+N_TRADES = 3
+NEXT_ID = 4
+# Number of non-empty levels per side, so emptying a side needs no ladder scan
+N_BID_LEVELS = 5
+N_ASK_LEVELS = 6
+STATE_SIZE = 7
+
+# Default capacity, arrays double in size whenever the freelist runs dry.
+# The trade buffers share this capacity: an incoming order can trade at most
+# once against every resting order, so they can never overflow.
+MAX_ORDERS = 1 << 17
+
+_IdMap = types.DictType(int64, int32)  # type: ignore[no-untyped-call]
+
+_MATCH_SIGNATURE = int64(
+    int8,       # incoming_side
+    int64,      # incoming_id
+    int64,      # limit_tick
+    int64,      # incoming_qty
+    int64[:],   # slot_ids
+    int64[:],   # slot_qtys
+    int32[:],   # next_idx
+    int32[:],   # prev_idx
+    int32[:],   # heads
+    int32[:],   # tails
+    int64[:],   # level_qty
+    int32[:],   # free_slots
+    _IdMap,     # id_to_slot
+    int64[:],   # state
+    int64[:],   # trade_buy_ids
+    int64[:],   # trade_sell_ids
+    int64[:],   # trade_ticks
+    int64[:],   # trade_qtys
+)
+
+_ADD_SIGNATURE = int32(
+    int8,       # side
+    int64,      # order_id
+    int64,      # tick
+    float64,    # price
+    int64,      # qty
+    int64[:],   # slot_ids
+    int64[:],   # slot_qtys
+    int64[:],   # slot_ticks
+    int32[:],   # next_idx
+    int32[:],   # prev_idx
+    int32[:],   # heads
+    int32[:],   # tails
+    int64[:],   # level_qty
+    float64[:], # level_prices
+    int32[:],   # free_slots
+    _IdMap,     # id_to_slot
+    int64[:],   # state
+)
+
+_CANCEL_SIGNATURE = boolean(
+    int64,      # order_id
+    int64[:],   # slot_qtys
+    int64[:],   # slot_ticks
+    int32[:],   # next_idx
+    int32[:],   # prev_idx
+    int32[:],   # heads
+    int32[:],   # tails
+    int64[:],   # level_qty
+    int32[:],   # free_slots
+    _IdMap,     # id_to_slot
+    int64[:],   # state
+)
+
+_DEPTH_SIGNATURE = int64(
+    int8,       # side
+    int64[:],   # level_qty
+    int64[:],   # state
+    int64[:],   # out_ticks
+    int64[:],   # out_qtys
+)
+
+
+@njit(_MATCH_SIGNATURE, cache=True)
+def match_njit(
+    incoming_side: int,
+    incoming_id: int,
+    limit_tick: int,
+    incoming_qty: int,
+    slot_ids: np.ndarray,
+    slot_qtys: np.ndarray,
+    next_idx: np.ndarray,
+    prev_idx: np.ndarray,
+    heads: np.ndarray,
+    tails: np.ndarray,
+    level_qty: np.ndarray,
+    free_slots: np.ndarray,
+    id_to_slot: NumbaDict,
+    state: np.ndarray,
+    trade_buy_ids: np.ndarray,
+    trade_sell_ids: np.ndarray,
+    trade_ticks: np.ndarray,
+    trade_qtys: np.ndarray,
+) -> int:
+    """
+    Match an incoming order against the opposite side until it is fully filled,
+    the book is empty, or the limit tick is violated.
+
+    Trades are appended to the trade_* buffers at offset state[N_TRADES].
+    Returns the remaining incoming quantity.
+    """
+    n_ticks = heads.shape[0]
+    n_trades = state[N_TRADES]
+    is_buy = incoming_side == BUY
+
+    while incoming_qty > 0:
+        if is_buy:
+            tick = state[BEST_ASK]
+            if tick > limit_tick:
+                # No liquidity (tick == n_ticks) or no acceptable price
+                break
+        else:
+            tick = state[BEST_BID]
+            if tick < limit_tick:
+                break
+
+        # Match first resting order at this price level (FIFO)
+        slot = heads[tick]
+        resting_qty = slot_qtys[slot]
+        # Branchless min(incoming_qty, resting_qty): diff >> 63 is all ones when
+        # diff < 0, else zero. Random order sizes make a compare unpredictable.
+        diff = incoming_qty - resting_qty
+        traded_qty = resting_qty + (diff & (diff >> 63))
+
+        if is_buy:
+            trade_buy_ids[n_trades] = incoming_id
+            trade_sell_ids[n_trades] = slot_ids[slot]
+        else:
+            trade_buy_ids[n_trades] = slot_ids[slot]
+            trade_sell_ids[n_trades] = incoming_id
+        trade_ticks[n_trades] = tick
+        trade_qtys[n_trades] = traded_qty
+        n_trades += 1
+
+        incoming_qty -= traded_qty
+        resting_qty -= traded_qty
+        slot_qtys[slot] = resting_qty
+        level_qty[tick] -= traded_qty
+
+        if resting_qty == 0:
+            # Remove this resting order from the head of the linked list
+            next_slot = next_idx[slot]
+            heads[tick] = next_slot
+            if next_slot != NIL:
+                prev_idx[next_slot] = NIL
+            else:
+                # Level became empty, move best price to next non-empty tick
+                # (or straight to the empty marker if it was the last level)
+                tails[tick] = NIL
+                if is_buy:
+                    state[N_ASK_LEVELS] -= 1
+                    t = n_ticks
+                    if state[N_ASK_LEVELS] > 0:
+                        t = tick + 1
+                        while heads[t] == NIL:
+                            t += 1
+                    state[BEST_ASK] = t
+                else:
+                    state[N_BID_LEVELS] -= 1
+                    t = NIL
+                    if state[N_BID_LEVELS] > 0:
+                        t = tick - 1
+                        while heads[t] == NIL:
+                            t -= 1
+                    state[BEST_BID] = t
+
+            del id_to_slot[slot_ids[slot]]
+            free_slots[state[FREE_TOP]] = slot
+            state[FREE_TOP] += 1
+
+    state[N_TRADES] = n_trades
+    return incoming_qty
+
+
+@njit(_ADD_SIGNATURE, cache=True)
+def add_resting_njit(
+    side: int,
+    order_id: int,
+    tick: int,
+    price: float,
+    qty: int,
+    slot_ids: np.ndarray,
+    slot_qtys: np.ndarray,
+    slot_ticks: np.ndarray,
+    next_idx: np.ndarray,
+    prev_idx: np.ndarray,
+    heads: np.ndarray,
+    tails: np.ndarray,
+    level_qty: np.ndarray,
+    level_prices: np.ndarray,
+    free_slots: np.ndarray,
+    id_to_slot: NumbaDict,
+    state: np.ndarray,
+) -> int:
+    """
+    Append an order to the tail of its price level (FIFO). The caller must make
+    sure a free slot is available. Returns the slot used.
+    """
+    top = state[FREE_TOP] - 1
+    slot: int = free_slots[top]
+    state[FREE_TOP] = top
+
+    slot_ids[slot] = order_id
+    slot_qtys[slot] = qty
+    slot_ticks[slot] = tick
+    next_idx[slot] = NIL
+
+    tail = tails[tick]
+    if tail == NIL:
+        # Empty level
+        heads[tick] = slot
+        prev_idx[slot] = NIL
+        level_prices[tick] = price
+        if side == BUY:
+            state[N_BID_LEVELS] += 1
+        else:
+            state[N_ASK_LEVELS] += 1
+    else:
+        next_idx[tail] = slot
+        prev_idx[slot] = tail
+    tails[tick] = slot
+    level_qty[tick] += qty
+
+    if side == BUY:
+        if tick > state[BEST_BID]:
+            state[BEST_BID] = tick
+    elif tick < state[BEST_ASK]:
+        state[BEST_ASK] = tick
+
+    id_to_slot[order_id] = slot
+    return slot
+
+
+_ADD_ORDER_SIGNATURE = boolean(
+    int8,       # side
+    boolean,    # has_id (False to generate an ID)
+    int64,      # order_id (ignored unless has_id)
+    int64,      # limit_tick
+    float64,    # price
+    int64,      # qty
+    boolean,    # rest remaining quantity (False for market orders)
+    int64[:],   # slot_ids
+    int64[:],   # slot_qtys
+    int64[:],   # slot_ticks
+    int32[:],   # next_idx
+    int32[:],   # prev_idx
+    int32[:],   # heads
+    int32[:],   # tails
+    int64[:],   # level_qty
+    float64[:], # level_prices
+    int32[:],   # free_slots
+    _IdMap,     # id_to_slot
+    int64[:],   # state
+    int64[:],   # trade_buy_ids
+    int64[:],   # trade_sell_ids
+    int64[:],   # trade_ticks
+    int64[:],   # trade_qtys
+)
+
+
+@njit(_ADD_ORDER_SIGNATURE, cache=True)
+def add_order_njit(
+    side: int,
+    has_id: bool,
+    order_id: int,
+    limit_tick: int,
+    price: float,
+    qty: int,
+    rest: bool,
+    slot_ids: np.ndarray,
+    slot_qtys: np.ndarray,
+    slot_ticks: np.ndarray,
+    next_idx: np.ndarray,
+    prev_idx: np.ndarray,
+    heads: np.ndarray,
+    tails: np.ndarray,
+    level_qty: np.ndarray,
+    level_prices: np.ndarray,
+    free_slots: np.ndarray,
+    id_to_slot: NumbaDict,
+    state: np.ndarray,
+    trade_buy_ids: np.ndarray,
+    trade_sell_ids: np.ndarray,
+    trade_ticks: np.ndarray,
+    trade_qtys: np.ndarray,
+) -> bool:
+    """
+    Assign or validate the order ID, match the order and rest any remaining
+    quantity, all in a single call from Python. The caller must make sure a
+    free slot and enough trade buffer space are available.
+    Returns False (leaving the book untouched) if order_id is a duplicate.
+    A generated ID is state[NEXT_ID] - 1 on return.
+    """
+    if not has_id:
+        # Generated IDs are kept above every user-supplied ID, so cannot clash
+        order_id = state[NEXT_ID]
+        state[NEXT_ID] = order_id + 1
+    elif order_id in id_to_slot:
+        return False
+    elif order_id >= state[NEXT_ID]:
+        state[NEXT_ID] = order_id + 1
+
+    remaining = match_njit(
+        side, order_id, limit_tick, qty,
+        slot_ids, slot_qtys, next_idx, prev_idx,
+        heads, tails, level_qty, free_slots, id_to_slot, state,
+        trade_buy_ids, trade_sell_ids, trade_ticks, trade_qtys,
+    )
+
+    # Rest remaining quantity after match on the book
+    if rest and remaining > 0:
+        add_resting_njit(
+            side, order_id, limit_tick, price, remaining,
+            slot_ids, slot_qtys, slot_ticks, next_idx, prev_idx,
+            heads, tails, level_qty, level_prices, free_slots, id_to_slot, state,
+        )
+    return True
+
+
+_ADD_BATCH_SIGNATURE = int64(
+    int64,      # start
+    int8[:],    # sides
+    int64[:],   # ticks
+    float64[:], # prices
+    int64[:],   # qtys
+    int64[:],   # out_ids
+    int64[:],   # slot_ids
+    int64[:],   # slot_qtys
+    int64[:],   # slot_ticks
+    int32[:],   # next_idx
+    int32[:],   # prev_idx
+    int32[:],   # heads
+    int32[:],   # tails
+    int64[:],   # level_qty
+    float64[:], # level_prices
+    int32[:],   # free_slots
+    _IdMap,     # id_to_slot
+    int64[:],   # state
+    int64[:],   # trade_buy_ids
+    int64[:],   # trade_sell_ids
+    int64[:],   # trade_ticks
+    int64[:],   # trade_qtys
+)
+
+
+@njit(_ADD_BATCH_SIGNATURE, cache=True)
+def add_limit_orders_njit(
+    start: int,
+    sides: np.ndarray,
+    ticks: np.ndarray,
+    prices: np.ndarray,
+    qtys: np.ndarray,
+    out_ids: np.ndarray,
+    slot_ids: np.ndarray,
+    slot_qtys: np.ndarray,
+    slot_ticks: np.ndarray,
+    next_idx: np.ndarray,
+    prev_idx: np.ndarray,
+    heads: np.ndarray,
+    tails: np.ndarray,
+    level_qty: np.ndarray,
+    level_prices: np.ndarray,
+    free_slots: np.ndarray,
+    id_to_slot: NumbaDict,
+    state: np.ndarray,
+    trade_buy_ids: np.ndarray,
+    trade_sell_ids: np.ndarray,
+    trade_ticks: np.ndarray,
+    trade_qtys: np.ndarray,
+) -> int:
+    """
+    Add limit orders from index start onwards with generated IDs (written to
+    out_ids), without returning to Python in between.
+
+    Stops early when the next order could run out of order slots or trade
+    buffer space. Returns the index of the first unprocessed order.
+    """
+    n_orders = sides.shape[0]
+    capacity = slot_ids.shape[0]
+    trade_cap = trade_qtys.shape[0]
+    i = start
+    while i < n_orders:
+        free = state[FREE_TOP]
+        if free == 0 or trade_cap - state[N_TRADES] < capacity - free:
+            break
+        add_order_njit(
+            sides[i], False, 0, ticks[i], prices[i], qtys[i], True,
+            slot_ids, slot_qtys, slot_ticks, next_idx, prev_idx,
+            heads, tails, level_qty, level_prices, free_slots, id_to_slot, state,
+            trade_buy_ids, trade_sell_ids, trade_ticks, trade_qtys,
+        )
+        out_ids[i] = state[NEXT_ID] - 1
+        i += 1
+    return i
+
+
+@njit(_CANCEL_SIGNATURE, cache=True)
+def cancel_njit(
+    order_id: int,
+    slot_qtys: np.ndarray,
+    slot_ticks: np.ndarray,
+    next_idx: np.ndarray,
+    prev_idx: np.ndarray,
+    heads: np.ndarray,
+    tails: np.ndarray,
+    level_qty: np.ndarray,
+    free_slots: np.ndarray,
+    id_to_slot: NumbaDict,
+    state: np.ndarray,
+) -> bool:
+    """
+    Unlink a resting order from its price level. Returns False if not found.
+    """
+    if order_id not in id_to_slot:
+        return False
+    slot = id_to_slot[order_id]
+    del id_to_slot[order_id]
+    tick = slot_ticks[slot]
+    n_ticks = heads.shape[0]
+
+    level_qty[tick] -= slot_qtys[slot]
+
+    prev_slot = prev_idx[slot]
+    next_slot = next_idx[slot]
+    if prev_slot != NIL:
+        next_idx[prev_slot] = next_slot
+    else:
+        heads[tick] = next_slot
+    if next_slot != NIL:
+        prev_idx[next_slot] = prev_slot
+    else:
+        tails[tick] = prev_slot
+
+    if heads[tick] == NIL:
+        # Level became empty, move best price if it was the best level.
+        # Every bid rests at or below the best bid and every ask above it.
+        if tick <= state[BEST_BID]:
+            state[N_BID_LEVELS] -= 1
+            if state[N_BID_LEVELS] == 0:
+                state[BEST_BID] = NIL
+            elif tick == state[BEST_BID]:
+                t = tick - 1
+                while heads[t] == NIL:
+                    t -= 1
+                state[BEST_BID] = t
+        else:
+            state[N_ASK_LEVELS] -= 1
+            if state[N_ASK_LEVELS] == 0:
+                state[BEST_ASK] = n_ticks
+            elif tick == state[BEST_ASK]:
+                t = tick + 1
+                while heads[t] == NIL:
+                    t += 1
+                state[BEST_ASK] = t
+
+    free_slots[state[FREE_TOP]] = slot
+    state[FREE_TOP] += 1
+    return True
+
+
+@njit(_DEPTH_SIGNATURE, cache=True)
+def depth_njit(
+    side: int,
+    level_qty: np.ndarray,
+    state: np.ndarray,
+    out_ticks: np.ndarray,
+    out_qtys: np.ndarray,
+) -> int:
+    """
+    Walk the ladder from the best price outwards, writing the first
+    len(out_ticks) non-empty levels. Returns the number of levels written.
+    """
+    n_ticks = level_qty.shape[0]
+    levels = out_ticks.shape[0]
+    count = 0
+    if side == BUY:
+        t = state[BEST_BID]
+        while t >= 0 and count < levels:
+            if level_qty[t] > 0:
+                out_ticks[count] = t
+                out_qtys[count] = level_qty[t]
+                count += 1
+            t -= 1
+    else:
+        t = state[BEST_ASK]
+        while t < n_ticks and count < levels:
+            if level_qty[t] > 0:
+                out_ticks[count] = t
+                out_qtys[count] = level_qty[t]
+                count += 1
+            t += 1
+    return count
+
+
+class NumbaOrderBook:
+    """
+    Drop-in alternative to order_book.OrderBook backed by Numba kernels.
+
+    Prices must lie on the tick grid min_price + k * tick_size for
+    0 <= k < n_ticks, anything else is rejected with ValueError.
+    Order timestamps only stamp the trades they generate, FIFO priority comes
+    from the per-level linked lists.
+    """
+    def __init__(
+        self,
+        tick_size: float = 0.01,
+        min_price: float = 0.0,
+        n_ticks: int = 20_000,
+        max_orders: int = MAX_ORDERS,
+    ) -> None:
+        self.tick_size = tick_size
+        self.min_price = min_price
+        self.n_ticks = n_ticks
+
+        # Order slots
+        self._slot_ids = np.zeros(max_orders, dtype=np.int64)
+        self._slot_qtys = np.zeros(max_orders, dtype=np.int64)
+        self._slot_ticks = np.zeros(max_orders, dtype=np.int64)
+        self._next_idx = np.full(max_orders, NIL, dtype=np.int32)
+        self._prev_idx = np.full(max_orders, NIL, dtype=np.int32)
+
+        # Freelist of slots, popped from the end (lowest slot first)
+        self._free_slots = np.arange(max_orders - 1, -1, -1, dtype=np.int32)
+
+        # Trade buffers filled by match_njit
+        self._trade_buy_ids = np.empty(max_orders, dtype=np.int64)
+        self._trade_sell_ids = np.empty(max_orders, dtype=np.int64)
+        self._trade_ticks = np.empty(max_orders, dtype=np.int64)
+        self._trade_qtys = np.empty(max_orders, dtype=np.int64)
+
+        # Price ladder
+        self._heads = np.full(n_ticks, NIL, dtype=np.int32)
+        self._tails = np.full(n_ticks, NIL, dtype=np.int32)
+        self._level_qty = np.zeros(n_ticks, dtype=np.int64)
+        self._level_prices = np.zeros(n_ticks, dtype=np.float64)
+
+        self._state = np.zeros(STATE_SIZE, dtype=np.int64)
+        self._state[BEST_BID] = NIL
+        self._state[BEST_ASK] = n_ticks
+        self._state[FREE_TOP] = max_orders
+        self._state[NEXT_ID] = 1
+
+        # Map order_id -> slot
+        self._id_to_slot = NumbaDict.empty(key_type=int64, value_type=int32)
+
+        # Trade log, kept as copies of the kernel trade buffers
+        # (buy_ids, sell_ids, prices, quantities, timestamp) and only turned
+        # into Trade objects by get_trades()
+        self._trade_chunks: List[
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, float]
+        ] = []
+
+    # ---------- Public API ----------
+
+    def add_limit_order(
+        self,
+        side: Side,
+        price: float,
+        quantity: int,
+        order_id: Optional[int] = None,
+        timestamp: Optional[float] = None,
+    ) -> int:
+        """
+        Add a limit order and immediately match against the opposite side.
+        Returns the order ID (generated if not supplied).
+        """
+        return self._add_order(
+            side, self._price_to_tick(price), price, quantity, order_id, timestamp, True
+        )
+
+    def add_limit_orders(
+        self,
+        sides: np.ndarray,
+        prices: np.ndarray,
+        quantities: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Add a batch of limit orders in arrival order, matching each one exactly
+        as add_limit_order would, in a single compiled loop.
+
+        sides holds the module-level BUY / SELL codes. Returns the generated
+        order IDs.
+        """
+        sides = np.asarray(sides, dtype=np.int8)
+        prices = np.asarray(prices, dtype=np.float64)
+        quantities = np.asarray(quantities, dtype=np.int64)
+
+        ticks = np.rint((prices - self.min_price) / self.tick_size).astype(np.int64)
+        if np.any(np.abs(self.min_price + ticks * self.tick_size - prices) > self.tick_size * 1e-6):
+            raise ValueError(f"Prices must be multiples of tick size {self.tick_size}.")
+        if np.any((ticks < 0) | (ticks >= self.n_ticks)):
+            raise ValueError("Prices must lie inside the order book price range.")
+
+        out_ids = np.empty(sides.shape[0], dtype=np.int64)
+        start = 0
+        while True:
+            self._state[N_TRADES] = 0
+            start = add_limit_orders_njit(
+                start, sides, ticks, prices, quantities, out_ids,
+                self._slot_ids, self._slot_qtys, self._slot_ticks,
+                self._next_idx, self._prev_idx,
+                self._heads, self._tails, self._level_qty, self._level_prices,
+                self._free_slots, self._id_to_slot, self._state,
+                self._trade_buy_ids, self._trade_sell_ids,
+                self._trade_ticks, self._trade_qtys,
+            )
+            self._flush_trades()
+            if start == sides.shape[0]:
+                return out_ids
+            if self._state[FREE_TOP] == 0:
+                self._grow()
+
+    def add_market_order(
+        self,
+        side: Side,
+        quantity: int,
+        order_id: Optional[int] = None,
+        timestamp: Optional[float] = None,
+    ) -> int:
+        """
+        Add a market order which matches against the best available prices
+        until it is fully filled or book is empty. Any remaining quantity is discarded.
+        """
+        # A market order is a limit order at the far end of the ladder that never rests
+        limit_tick = self.n_ticks - 1 if side is Side.BUY else 0
+        return self._add_order(side, limit_tick, 0.0, quantity, order_id, timestamp, False)
+
+    def cancel_order(self, order_id: int) -> bool:
+        """
+        Cancel an existing resting order. Returns True if cancelled, False if not found
+        or already fully executed.
+        """
+        return bool(
+            cancel_njit(
+                order_id, self._slot_qtys, self._slot_ticks,
+                self._next_idx, self._prev_idx,
+                self._heads, self._tails, self._level_qty,
+                self._free_slots, self._id_to_slot, self._state,
+            )
+        )
+
+    def best_bid(self) -> Optional[Tuple[float, int]]:
+        """
+        Return (price, total_quantity_at_price) for best bid, or None if no bids.
+        """
+        tick = int(self._state[BEST_BID])
+        if tick == NIL:
+            return None
+        return float(self._level_prices[tick]), int(self._level_qty[tick])
+
+    def best_ask(self) -> Optional[Tuple[float, int]]:
+        """
+        Return (price, total_quantity_at_price) for best ask, or None if no asks.
+        """
+        tick = int(self._state[BEST_ASK])
+        if tick == self.n_ticks:
+            return None
+        return float(self._level_prices[tick]), int(self._level_qty[tick])
+
+    def get_depth(self, side: Side, levels: int = 5) -> List[Tuple[float, int]]:
+        """
+        Return top N price levels on given side as list of (price, total_quantity),
+        sorted best-to-worst (descending for bids, ascending for asks).
+        """
+        out_ticks = np.empty(max(levels, 0), dtype=np.int64)
+        out_qtys = np.empty(max(levels, 0), dtype=np.int64)
+        count = depth_njit(
+            BUY if side is Side.BUY else SELL,
+            self._level_qty, self._state, out_ticks, out_qtys,
+        )
+        return [
+            (float(self._level_prices[t]), int(q))
+            for t, q in zip(out_ticks[:count], out_qtys[:count])
+        ]
+
+    def get_trades(self) -> List[Trade]:
+        """
+        Return list of all trades executed so far.
+        """
+        trades: List[Trade] = []
+        for buy_ids, sell_ids, prices, qtys, ts in self._trade_chunks:
+            for buy_id, sell_id, price, qty in zip(
+                buy_ids.tolist(), sell_ids.tolist(), prices.tolist(), qtys.tolist()
+            ):
+                trades.append(Trade(buy_id, sell_id, price, qty, ts))
+        return trades
+
+    # ---------- Internal helpers ----------
+
+    def _price_to_tick(self, price: float) -> int:
+        """
+        Convert a price to its ladder index, rejecting off-grid or out-of-range prices.
+        """
+        tick = round((price - self.min_price) / self.tick_size)
+        if abs(self.min_price + tick * self.tick_size - price) > self.tick_size * 1e-6:
+            raise ValueError(f"Price {price} is not a multiple of tick size {self.tick_size}.")
+        if not 0 <= tick < self.n_ticks:
+            raise ValueError(f"Price {price} is outside the order book price range.")
+        return tick
+
+    def _add_order(
+        self,
+        side: Side,
+        limit_tick: int,
+        price: float,
+        quantity: int,
+        order_id: Optional[int],
+        timestamp: Optional[float],
+        rest: bool,
+    ) -> int:
+        """
+        Run add_order_njit for one order and append its trades to the trade log.
+        """
+        if self._state[FREE_TOP] == 0:
+            self._grow()
+
+        self._state[N_TRADES] = 0
+        accepted = add_order_njit(
+            BUY if side is Side.BUY else SELL,
+            order_id is not None,
+            0 if order_id is None else order_id,
+            limit_tick, price, quantity, rest,
+            self._slot_ids, self._slot_qtys, self._slot_ticks,
+            self._next_idx, self._prev_idx,
+            self._heads, self._tails, self._level_qty, self._level_prices,
+            self._free_slots, self._id_to_slot, self._state,
+            self._trade_buy_ids, self._trade_sell_ids,
+            self._trade_ticks, self._trade_qtys,
+        )
+        if not accepted:
+            raise ValueError(f"Order ID {order_id} already exists in the order book.")
+
+        self._flush_trades(timestamp)
+        if order_id is None:
+            return int(self._state[NEXT_ID] - 1)
+        return order_id
+
+    def _flush_trades(self, timestamp: Optional[float] = None) -> None:
+        """
+        Append the trades written by the last kernel call to the trade log,
+        stamped with timestamp (one clock read for the chunk if not given).
+        """
+        n_trades = self._state[N_TRADES]
+        if n_trades:
+            self._trade_chunks.append(
+                (
+                    self._trade_buy_ids[:n_trades].copy(),
+                    self._trade_sell_ids[:n_trades].copy(),
+                    self._level_prices[self._trade_ticks[:n_trades]],
+                    self._trade_qtys[:n_trades].copy(),
+                    time.time() if timestamp is None else timestamp,
+                )
+            )
+
+    def _grow(self) -> None:
+        """
+        Double the number of order slots (and trade buffers) and push the new
+        slots onto the freelist.
+        """
+        old = self._slot_ids.shape[0]
+        new = old * 2
+
+        def extend(arr: np.ndarray, fill: int) -> np.ndarray:
+            return np.concatenate([arr, np.full(old, fill, dtype=arr.dtype)])
+
+        self._slot_ids = extend(self._slot_ids, 0)
+        self._slot_qtys = extend(self._slot_qtys, 0)
+        self._slot_ticks = extend(self._slot_ticks, 0)
+        self._next_idx = extend(self._next_idx, NIL)
+        self._prev_idx = extend(self._prev_idx, NIL)
+        self._trade_buy_ids = np.empty(new, dtype=np.int64)
+        self._trade_sell_ids = np.empty(new, dtype=np.int64)
+        self._trade_ticks = np.empty(new, dtype=np.int64)
+        self._trade_qtys = np.empty(new, dtype=np.int64)
+
+        self._free_slots = np.empty(new, dtype=np.int32)
+        self._free_slots[:old] = np.arange(new - 1, old - 1, -1, dtype=np.int32)
+        self._state[FREE_TOP] = old
@@ -0,0 +1,11 @@
+from Cython.Build import cythonize
+from setuptools import setup
+
+# Build the optional Cython order book in place:
+#   python setup.py build_ext --inplace
+setup(
+    name="order_book_ext",
+    ext_modules=cythonize(  # type: ignore[no-untyped-call]
+        "order_book_ext.pyx", language_level=3, annotate=True
+    ),
+)
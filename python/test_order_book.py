@@ -280,3 +280,171 @@ def test_market_order_stops_when_book_empty():
 
     assert ob.best_bid() is None
     assert ob.best_ask() is None
+
+
+def test_get_depth_sorted_best_to_worst():
+    """
+    Scenario:
+    - Add three BUYs at 9.0, 10.0, 8.0 and three SELLs at 12.0, 11.0, 13.0.
+    - Depth for bids should be descending, depth for asks ascending.
+    - Only the requested number of levels is returned.
+    """
+    ob = make_book()
+    ob.add_limit_order(Side.BUY, price=9.0, quantity=10)
+    ob.add_limit_order(Side.BUY, price=10.0, quantity=20)
+    ob.add_limit_order(Side.BUY, price=8.0, quantity=30)
+    ob.add_limit_order(Side.SELL, price=12.0, quantity=40)
+    ob.add_limit_order(Side.SELL, price=11.0, quantity=50)
+    ob.add_limit_order(Side.SELL, price=13.0, quantity=60)
+
+    assert ob.get_depth(Side.BUY) == [(10.0, 20), (9.0, 10), (8.0, 30)]
+    assert ob.get_depth(Side.SELL) == [(11.0, 50), (12.0, 40), (13.0, 60)]
+
+    assert ob.get_depth(Side.BUY, levels=2) == [(10.0, 20), (9.0, 10)]
+    assert ob.get_depth(Side.SELL, levels=1) == [(11.0, 50)]
+    assert ob.get_depth(Side.BUY, levels=0) == []
+    assert make_book().get_depth(Side.SELL) == []
+
+
+def test_level_quantity_tracks_fills_and_cancels():
+    """
+    Scenario:
+    - Three BUYs at 10.0: b1 (100), b2 (50), b3 (25) -> level total 175.
+    - Cancel b2 -> level total 125.
+    - SELL at 10.0 for 110 fills b1 and 10 of b3 -> level total 15.
+    """
+    ob = make_book()
+    ob.add_limit_order(Side.BUY, price=10.0, quantity=100)
+    b2 = ob.add_limit_order(Side.BUY, price=10.0, quantity=50)
+    ob.add_limit_order(Side.BUY, price=10.0, quantity=25)
+
+    assert ob.best_bid() == (10.0, 175)
+
+    assert ob.cancel_order(b2) is True
+    assert ob.best_bid() == (10.0, 125)
+
+    ob.add_limit_order(Side.SELL, price=10.0, quantity=110)
+    assert ob.best_bid() == (10.0, 15)
+    assert ob.get_depth(Side.BUY) == [(10.0, 15)]
+
+
+def test_off_grid_and_out_of_range_prices_are_rejected():
+    """
+    Scenario:
+    - Book uses a 0.01 tick ladder covering [0.0, 200.0).
+    - Prices between ticks or outside the ladder raise ValueError and leave
+      the book untouched.
+    """
+    ob = OrderBook(tick_size=0.01, min_price=0.0, n_ticks=20_000)
+
+    with pytest.raises(ValueError):
+        ob.add_limit_order(Side.BUY, price=10.005, quantity=10)
+    with pytest.raises(ValueError):
+        ob.add_limit_order(Side.BUY, price=-0.01, quantity=10)
+    with pytest.raises(ValueError):
+        ob.add_limit_order(Side.SELL, price=200.0, quantity=10)
+
+    assert ob.best_bid() is None
+    assert ob.best_ask() is None
+
+    ob.add_limit_order(Side.SELL, price=199.99, quantity=10)
+    assert ob.best_ask() == (199.99, 10)
+
+
+def test_generated_ids_skip_past_user_supplied_ids():
+    """
+    Scenario:
+    - A generated ID (1), then a user-supplied ID 10, then a generated ID.
+    - Generated IDs continue above the largest user ID (11), so they can never
+      clash with a user-supplied ID.
+    - A user ID below the counter that is not resting is still accepted.
+    """
+    ob = make_book()
+
+    assert ob.add_limit_order(Side.BUY, price=9.0, quantity=10) == 1
+    assert ob.add_limit_order(Side.BUY, price=9.0, quantity=10, order_id=10) == 10
+    assert ob.add_limit_order(Side.BUY, price=9.0, quantity=10) == 11
+
+    with pytest.raises(ValueError):
+        ob.add_limit_order(Side.BUY, price=9.0, quantity=10, order_id=10)
+
+    assert ob.add_limit_order(Side.BUY, price=9.0, quantity=10, order_id=5) == 5
+    assert ob.add_market_order(Side.SELL, quantity=10) == 12
+
+
+def test_unlinked_nodes_are_recycled():
+    """
+    Scenario:
+    - b1 is filled and b2 cancelled, both nodes go back to the pool without
+      holding on to their orders.
+    - The next two resting orders reuse those nodes and keep FIFO order.
+    """
+    ob = make_book()
+    b1 = ob.add_limit_order(Side.BUY, price=10.0, quantity=10)
+    b2 = ob.add_limit_order(Side.BUY, price=10.0, quantity=10)
+    n1, n2 = ob.order_map[b1], ob.order_map[b2]
+
+    ob.add_limit_order(Side.SELL, price=10.0, quantity=10)
+    assert ob.cancel_order(b2) is True
+    assert len(ob._node_pool) == 2
+    assert ob._node_pool[0] is n1 and ob._node_pool[1] is n2
+    assert not hasattr(n1, "order") and not hasattr(n2, "order")
+
+    # LIFO: the most recently freed node is handed out first
+    b3 = ob.add_limit_order(Side.BUY, price=9.0, quantity=5)
+    b4 = ob.add_limit_order(Side.BUY, price=9.0, quantity=7)
+    assert ob.order_map[b3] is n2 and ob.order_map[b4] is n1
+    assert not ob._node_pool
+    assert ob.order_map[b3].next is ob.order_map[b4]
+
+    s = ob.add_market_order(Side.SELL, quantity=12)
+    assert [(t.buy_order_id, t.sell_order_id, t.quantity) for t in ob.get_trades()[1:]] == [
+        (b3, s, 5),
+        (b4, s, 7),
+    ]
+    assert ob.best_bid() is None
+
+
+def test_trades_share_incoming_order_timestamp():
+    """
+    Scenario:
+    - Two SELLs rest at 10.0 and 10.5, a BUY with timestamp 123.0 sweeps both.
+    - Both trades carry the BUY's timestamp, a single clock read per order.
+    """
+    ob = make_book()
+    ob.add_limit_order(Side.SELL, price=10.0, quantity=10, timestamp=1.0)
+    ob.add_limit_order(Side.SELL, price=10.5, quantity=10, timestamp=2.0)
+
+    ob.add_limit_order(Side.BUY, price=10.5, quantity=20, timestamp=123.0)
+
+    assert [t.timestamp for t in ob.get_trades()] == [123.0, 123.0]
+
+
+def test_emptying_a_side_repeatedly_resets_best_price():
+    """
+    Scenario:
+    - Repeatedly rest a BUY at 100.0 and fill it with a SELL, then rest a SELL
+      and cancel it, so each side keeps going back to empty.
+    - The emptied side reports no best price every time, and a new order on
+      it becomes the best price again.
+    """
+    ob = make_book()
+    for _ in range(1_000):
+        ob.add_limit_order(Side.BUY, price=100.0, quantity=10)
+        ob.add_limit_order(Side.SELL, price=100.0, quantity=10)
+        assert ob.best_bid() is None
+        assert ob.best_ask() is None
+
+        s = ob.add_limit_order(Side.SELL, price=100.5, quantity=5)
+        assert ob.best_ask() == (100.5, 5)
+        assert ob.cancel_order(s) is True
+        assert ob.best_ask() is None
+
+    # Two levels on a side: emptying the best one falls back to the other
+    ob.add_limit_order(Side.BUY, price=99.0, quantity=1)
+    b = ob.add_limit_order(Side.BUY, price=99.5, quantity=1)
+    assert ob.cancel_order(b) is True
+    assert ob.best_bid() == (99.0, 1)
+    ob.add_market_order(Side.SELL, quantity=1)
+    assert ob.best_bid() is None
+    assert ob.get_depth(Side.BUY) == []
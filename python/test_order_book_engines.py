@@ -0,0 +1,255 @@
+import importlib
+import random
+
+import pytest
+
+from order_book import OrderBook, Side
+
+
+# (module, class) of every compiled engine sharing OrderBook's API
+ENGINES = [
+    ("order_book_numba", "NumbaOrderBook"),
+    ("order_book_ext", "COrderBook"),
+]
+
+
+@pytest.fixture(params=ENGINES, ids=[name for _, name in ENGINES])
+def make_book(request):
+    """
+    Factory for fresh order books of each compiled engine, skipping engines
+    whose module cannot be imported (Numba not installed, extension not built).
+    """
+    module_name, class_name = request.param
+    module = pytest.importorskip(module_name)
+    return getattr(module, class_name)
+
+
+def key(trades):
+    return [(t.buy_order_id, t.sell_order_id, t.price, t.quantity) for t in trades]
+
+
+def test_crossing_and_resting(make_book):
+    """
+    Scenario:
+    - Two SELLs at 10.0 (s1 then s2) and one at 11.0 (s3), one BUY at 9.0.
+    - BUY at 11.0 for 250 sweeps s1, s2 and 50 of s3 in price-time order.
+    - Remaining book: 9.0 bid and 50 left at 11.0.
+    """
+    ob = make_book()
+    s1 = ob.add_limit_order(Side.SELL, price=10.0, quantity=100)
+    s2 = ob.add_limit_order(Side.SELL, price=10.0, quantity=100)
+    s3 = ob.add_limit_order(Side.SELL, price=11.0, quantity=100)
+    ob.add_limit_order(Side.BUY, price=9.0, quantity=70)
+
+    b = ob.add_limit_order(Side.BUY, price=11.0, quantity=250)
+
+    trades = ob.get_trades()
+    assert [(t.buy_order_id, t.sell_order_id, t.quantity) for t in trades] == [
+        (b, s1, 100),
+        (b, s2, 100),
+        (b, s3, 50),
+    ]
+    assert [t.price for t in trades] == [10.0, 10.0, 11.0]
+
+    assert ob.best_bid() == (9.0, 70)
+    assert ob.best_ask() == (11.0, 50)
+
+
+def test_cancel_and_market_order(make_book):
+    """
+    Scenario:
+    - Two BUYs at 10.0 (b1, b2) and one at 9.5 (b3); cancel b1.
+    - Market SELL for 120 fills b2 (100) then 20 of b3.
+    - Cancelled and filled orders can no longer be cancelled.
+    """
+    ob = make_book()
+    b1 = ob.add_limit_order(Side.BUY, price=10.0, quantity=100)
+    b2 = ob.add_limit_order(Side.BUY, price=10.0, quantity=100)
+    b3 = ob.add_limit_order(Side.BUY, price=9.5, quantity=100)
+
+    assert ob.cancel_order(b1) is True
+    assert ob.best_bid() == (10.0, 100)
+
+    s = ob.add_market_order(Side.SELL, quantity=120)
+
+    trades = ob.get_trades()
+    assert [(t.buy_order_id, t.sell_order_id, t.quantity) for t in trades] == [
+        (b2, s, 100),
+        (b3, s, 20),
+    ]
+    assert ob.best_bid() == (9.5, 80)
+    assert ob.cancel_order(b1) is False
+    assert ob.cancel_order(b2) is False
+    assert ob.cancel_order(b3) is True
+    assert ob.best_bid() is None
+
+
+def test_invalid_prices_and_duplicate_ids_are_rejected(make_book):
+    """
+    Scenario:
+    - Prices must sit on the tick grid inside [min_price, min_price + n_ticks * tick_size).
+    - Reusing the ID of a resting order raises ValueError.
+    """
+    ob = make_book(tick_size=0.01, min_price=0.0, n_ticks=20_000)
+
+    with pytest.raises(ValueError):
+        ob.add_limit_order(Side.BUY, price=10.005, quantity=10)
+    with pytest.raises(ValueError):
+        ob.add_limit_order(Side.BUY, price=-0.01, quantity=10)
+    with pytest.raises(ValueError):
+        ob.add_limit_order(Side.SELL, price=200.0, quantity=10)
+
+    assert ob.best_bid() is None
+    assert ob.best_ask() is None
+
+    ob.add_limit_order(Side.BUY, price=10.0, quantity=10, order_id=42)
+    with pytest.raises(ValueError):
+        ob.add_limit_order(Side.BUY, price=10.0, quantity=10, order_id=42)
+
+    assert ob.best_bid() == (10.0, 10)
+
+
+def test_order_slots_grow_beyond_initial_capacity(make_book):
+    """
+    Scenario:
+    - Book created with room for 4 orders, then 10 BUYs rest on the book.
+    - A SELL sweeping all of them matches in price-time order.
+    """
+    ob = make_book(max_orders=4)
+    ids = [ob.add_limit_order(Side.BUY, price=10.0 + i % 3, quantity=10) for i in range(10)]
+
+    assert ob.get_depth(Side.BUY) == [(12.0, 30), (11.0, 30), (10.0, 40)]
+
+    ob.add_limit_order(Side.SELL, price=10.0, quantity=100)
+    assert [t.buy_order_id for t in ob.get_trades()] == (
+        ids[2::3] + ids[1::3] + ids[0::3]
+    )
+    assert ob.best_bid() is None
+
+
+def test_sweep_records_every_trade(make_book):
+    """
+    Scenario:
+    - Book created with room for 4 orders, then 5000 single-unit SELLs rest.
+    - One BUY sweeping all of them must record every trade, in FIFO order.
+    """
+    ob = make_book(max_orders=4)
+    n = 5_000
+    for _ in range(n):
+        ob.add_limit_order(Side.SELL, price=10.0, quantity=1)
+
+    ob.add_limit_order(Side.BUY, price=10.0, quantity=n + 10)
+
+    trades = ob.get_trades()
+    assert len(trades) == n
+    assert [t.sell_order_id for t in trades] == list(range(1, n + 1))
+    assert ob.best_ask() is None
+    assert ob.best_bid() == (10.0, 10)
+
+
+def test_matches_python_order_book(make_book):
+    """
+    Scenario:
+    - Replay the same random stream of limit, market and cancel orders into
+      OrderBook and the compiled engine.
+    - Trades, best prices and depth must be identical.
+    """
+    rng = random.Random(7)
+    py_ob = OrderBook()
+    ob = make_book(max_orders=64)
+    resting = []
+
+    for _ in range(5_000):
+        action = rng.random()
+        side = Side.BUY if rng.random() < 0.5 else Side.SELL
+        quantity = rng.randint(1, 100)
+        if action < 0.8:
+            price = round(100.0 + rng.randint(-50, 50) * 0.01, 2)
+            oid = py_ob.add_limit_order(side, price, quantity)
+            assert ob.add_limit_order(side, price, quantity) == oid
+            resting.append(oid)
+        elif action < 0.9:
+            oid = py_ob.add_market_order(side, quantity)
+            assert ob.add_market_order(side, quantity) == oid
+        elif resting:
+            oid = resting.pop(rng.randrange(len(resting)))
+            assert ob.cancel_order(oid) == py_ob.cancel_order(oid)
+
+    assert key(ob.get_trades()) == key(py_ob.get_trades())
+    assert ob.best_bid() == py_ob.best_bid()
+    assert ob.best_ask() == py_ob.best_ask()
+    for side in (Side.BUY, Side.SELL):
+        assert ob.get_depth(side, levels=20) == py_ob.get_depth(side, levels=20)
+
+
+def test_non_positive_quantities_behave_like_python_book(make_book):
+    """
+    Scenario:
+    - One SELL rests at 100.0.
+    - Limit and market orders for 0 or -1 units neither trade nor rest, and
+      still get an ID, exactly as in OrderBook.
+    """
+    py_ob = OrderBook()
+    ob = make_book()
+    for book in (py_ob, ob):
+        book.add_limit_order(Side.SELL, price=100.0, quantity=5)
+
+    for book in (py_ob, ob):
+        ids = [
+            book.add_limit_order(Side.BUY, price=100.0, quantity=-1),
+            book.add_limit_order(Side.BUY, price=100.0, quantity=0),
+            book.add_limit_order(Side.SELL, price=101.0, quantity=-1),
+            book.add_market_order(Side.BUY, quantity=-1),
+        ]
+        assert ids == [2, 3, 4, 5]
+        assert book.get_trades() == []
+        assert book.best_bid() is None
+        assert book.best_ask() == (100.0, 5)
+
+
+def test_negative_order_ids_are_kept(make_book):
+    """
+    Scenario:
+    - A BUY rests with the user-supplied ID -1, which is kept as is.
+    - Reusing -1 while it rests raises ValueError, generated IDs start at 1.
+    - A SELL fills it and the trade reports buy ID -1.
+    """
+    ob = make_book()
+    assert ob.add_limit_order(Side.BUY, price=10.0, quantity=10, order_id=-1) == -1
+    with pytest.raises(ValueError):
+        ob.add_limit_order(Side.BUY, price=10.0, quantity=10, order_id=-1)
+    assert ob.best_bid() == (10.0, 10)
+
+    s = ob.add_limit_order(Side.SELL, price=10.0, quantity=10)
+    assert s == 1
+    assert key(ob.get_trades()) == [(-1, s, 10.0, 10)]
+    assert ob.cancel_order(-1) is False
+
+
+def test_emptying_a_side_repeatedly_resets_best_price(make_book):
+    """
+    Scenario:
+    - Repeatedly rest a BUY at 100.0 and fill it with a SELL, then rest a SELL
+      and cancel it, so each side keeps going back to empty.
+    - The emptied side reports no best price every time, and with two levels
+      on a side emptying the best one falls back to the other.
+    """
+    ob = make_book()
+    for _ in range(1_000):
+        ob.add_limit_order(Side.BUY, price=100.0, quantity=10)
+        ob.add_limit_order(Side.SELL, price=100.0, quantity=10)
+        assert ob.best_bid() is None
+        assert ob.best_ask() is None
+
+        s = ob.add_limit_order(Side.SELL, price=100.5, quantity=5)
+        assert ob.best_ask() == (100.5, 5)
+        assert ob.cancel_order(s) is True
+        assert ob.best_ask() is None
+
+    ob.add_limit_order(Side.SELL, price=101.0, quantity=1)
+    s = ob.add_limit_order(Side.SELL, price=100.5, quantity=1)
+    assert ob.cancel_order(s) is True
+    assert ob.best_ask() == (101.0, 1)
+    ob.add_market_order(Side.BUY, quantity=1)
+    assert ob.best_ask() is None
+    assert ob.get_depth(Side.SELL) == []
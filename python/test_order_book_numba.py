@@ -0,0 +1,48 @@
+import pytest
+
+pytest.importorskip("numba")
+
+import numpy as np
+
+from order_book import Side
+from order_book_numba import BUY, SELL, NumbaOrderBook
+
+
+def make_book(**kwargs) -> NumbaOrderBook:
+    """
+    Create a fresh Numba order book for each test.
+    """
+    return NumbaOrderBook(**kwargs)
+
+
+def test_batch_matches_single_orders():
+    """
+    Scenario:
+    - Feed the same random limit orders through add_limit_orders (one compiled
+      loop) and add_limit_order (one call per order).
+    - Generated IDs, trades and resulting book must be identical.
+    """
+    rng = np.random.default_rng(3)
+    n = 20_000
+    sides = np.where(rng.integers(0, 2, n) == 1, BUY, SELL).astype(np.int8)
+    prices = np.round(100.0 + rng.integers(-50, 51, n) * 0.01, 2)
+    quantities = rng.integers(1, 101, n)
+
+    batch_ob = make_book(max_orders=16)
+    single_ob = make_book(max_orders=16)
+
+    batch_ids = batch_ob.add_limit_orders(sides, prices, quantities)
+    single_ids = [
+        single_ob.add_limit_order(
+            Side.BUY if sides[i] == BUY else Side.SELL, float(prices[i]), int(quantities[i])
+        )
+        for i in range(n)
+    ]
+
+    def key(trades):
+        return [(t.buy_order_id, t.sell_order_id, t.price, t.quantity) for t in trades]
+
+    assert batch_ids.tolist() == single_ids
+    assert key(batch_ob.get_trades()) == key(single_ob.get_trades())
+    for side in (Side.BUY, Side.SELL):
+        assert batch_ob.get_depth(side, levels=100) == single_ob.get_depth(side, levels=100)